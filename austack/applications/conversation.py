@@ -1,6 +1,8 @@
+import asyncio
 import logging
+import re
 from typing import Optional
-from fastapi import WebSocket, WebSocketException
+from fastapi import WebSocket, WebSocketDisconnect, WebSocketException
 from austack.core.base import (
     AsyncSpeechToTextBase,
     AsyncTextToSpeechBase,
@@ -18,6 +20,12 @@ logger = logging.getLogger(__name__)
 
 
 class ConversationApp:
+    # Outgoing TTS audio is coalesced until this many bytes are buffered or the flush delay elapses
+    TX_FLUSH_BYTES = 4096
+    TX_FLUSH_DELAY = 0.01
+    # Start generating a response once the same partial transcript has been seen this many times in a row
+    SPECULATION_STABLE_PARTIALS = 3
+
     def __init__(
         self,
         websocket: WebSocket,
@@ -30,69 +38,189 @@ class ConversationApp:
     ):
         self.websocket = websocket
         self.is_running = False
+        self.is_agent_turn = False
+        self.tx_buffer = bytearray()
+        self.tx_flush_handle: asyncio.TimerHandle | None = None
+        self.tx_flush_task: asyncio.Task | None = None
+
+        # Speculative response state; sentences are held back until the final transcript confirms the prompt
+        self.last_partial = ""
+        self.stable_partials = 0
+        self.speculative_prompt: str | None = None
+        self.speculative_task: asyncio.Task | None = None
+        self.speculative_sentences: list[str] | None = None
 
         # Initialize components
-        self.stt = stt or DeepgramSpeechToTextManager()
-        self.tts = tts or DeepgramTextToSpeechManager()
-        self.llm = llm or BamlLLMManager()
+        if stt is None:
+            stt = DeepgramSpeechToTextManager()
+        if tts is None:
+            tts = DeepgramTextToSpeechManager()
+        if llm is None:
+            llm = BamlLLMManager()
+        self.stt = stt
+        self.tts = tts
+        self.llm = llm
 
         # Initialize turn taking manager
-        self.turn_taking_manager = TurnTakingManager()
+        self.turn_taking_manager = TurnTakingManager(on_turn_change=self._set_agent_turn)
 
         # Setup callbacks
         self.stt.setup(on_final=self.on_stt_full_transcript, on_partial=self.on_stt_partial_transcript)
         self.tts.setup(on_partial=self.on_tts_partial_audio)
-        self.llm.setup(on_full_response=on_llm_sentence or self.on_llm_sentence)
+        self.llm_sentence_handler = on_llm_sentence or self.on_llm_sentence
+        # Sentences go to TTS as they are generated; the LLM manager records the full response in its history
+        self.llm.setup(on_sentence=self._on_llm_output)
+
+    def _set_agent_turn(self, is_agent_turn: bool):
+        # Mirrored from the turn taking manager so the per-chunk audio path is a single attribute check
+        self.is_agent_turn = is_agent_turn
+
+    @staticmethod
+    def _normalize_transcript(transcript: str) -> str:
+        return " ".join(re.sub(r"[^\w\s]", "", transcript.lower()).split())
 
     async def on_stt_full_transcript(self, transcript: str):
         logger.info(f"STT final transcript: {transcript}")
+        self.last_partial = ""
+        self.stable_partials = 0
+
+        task, prompt = self.speculative_task, self.speculative_prompt
+        if task and prompt is not None and self._normalize_transcript(prompt) == self._normalize_transcript(transcript):
+            logger.info("Speculative response confirmed")
+            self.speculative_task = None
+            self.speculative_prompt = None
+            self.turn_taking_manager.start_agent_turn()
+            await self._flush_speculative_sentences()
+            await task
+            return
+
+        if task:
+            await self._cancel_speculation()
         self.turn_taking_manager.start_agent_turn()
         await self.llm.generate_response(transcript)
 
     async def on_stt_partial_transcript(self, transcript: str):
-        await self.turn_taking_manager.start_user_turn(self.llm)
+        if self.is_agent_turn:
+            await self.turn_taking_manager.start_user_turn(self.llm)
+
+        if transcript != self.last_partial:
+            # The user kept talking, so any speculative response is for an outdated prompt
+            self.last_partial = transcript
+            self.stable_partials = 1
+            if self.speculative_task:
+                await self._cancel_speculation()
+            return
+
+        self.stable_partials += 1
+        if self.stable_partials >= self.SPECULATION_STABLE_PARTIALS and self.speculative_task is None:
+            logger.info(f"Starting speculative response for: {transcript}")
+            self.speculative_prompt = transcript
+            self.speculative_sentences = []
+            self.speculative_task = asyncio.create_task(self.llm.generate_response(transcript))
+
+    async def _cancel_speculation(self):
+        task = self.speculative_task
+        self.speculative_task = None
+        self.speculative_prompt = None
+        self.speculative_sentences = None
+        await self.llm.interrupt(save_in_conversation=False)
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _flush_speculative_sentences(self):
+        # Sentences produced while flushing are appended to the same list, which keeps them in order
+        while self.speculative_sentences:
+            await self.llm_sentence_handler(self.speculative_sentences.pop(0))
+        self.speculative_sentences = None
+
+    async def _on_llm_output(self, text: str):
+        if self.speculative_sentences is not None:
+            self.speculative_sentences.append(text)
+            return
+        await self.llm_sentence_handler(text)
 
     async def on_llm_sentence(self, text: str):
         logger.info(f"LLM sentence: {text}")
-        if self.turn_taking_manager.is_agent_turn:
+        if self.is_agent_turn:
             await self.tts.synthesize(text)
         else:
-            logger.info("Blocked LLM sentence - not agent turn")
+            logger.debug("Blocked LLM sentence - not agent turn")
 
     async def on_tts_partial_audio(self, audio: bytes):
-        if self.turn_taking_manager.is_agent_turn:
-            await self.websocket.send_bytes(audio)
-        else:
-            logger.info("Blocked TTS audio - not agent turn")
+        if not self.is_agent_turn:
+            return
+
+        self.tx_buffer += audio
+        if len(self.tx_buffer) >= self.TX_FLUSH_BYTES:
+            await self.flush_tx_buffer()
+        elif self.tx_flush_handle is None:
+            self.tx_flush_handle = asyncio.get_running_loop().call_later(self.TX_FLUSH_DELAY, self._on_tx_flush_timer)
+
+    def _on_tx_flush_timer(self):
+        self.tx_flush_handle = None
+        self.tx_flush_task = asyncio.create_task(self.flush_tx_buffer())
+
+    async def flush_tx_buffer(self):
+        if self.tx_flush_handle:
+            self.tx_flush_handle.cancel()
+            self.tx_flush_handle = None
+        if not self.tx_buffer:
+            return
+
+        data = bytes(self.tx_buffer)
+        self.tx_buffer.clear()
+        # Audio buffered before an interruption is dropped rather than sent late
+        if self.is_agent_turn:
+            await self.websocket.send_bytes(data)
 
     async def start(self):
         self.is_running = True
 
-        await self.stt.start()
-        await self.tts.start()
-
-        while self.is_running:
-            try:
-                data = await self.websocket.receive()
-
-                if "bytes" in data:
-                    await self.stt.add_audio_chunk(data["bytes"])
-                    continue
-                elif "text" in data:
-                    pass
-                else:
-                    logger.error(f"Unknown message type: {data}")
-            except WebSocketException:
-                logger.info("Client disconnected")
-                break
-            except BaseException as e:
-                logger.error(f"Error receiving data: {e}")
-                break
-
-        await self.stop()
+        # Connect both services up front and in parallel so the first sentence doesn't pay the TTS handshake
+        # Both starts run to completion so a failure in one can't leave the other acquiring a connection after stop()
+        try:
+            results = await asyncio.gather(self.stt.start(), self.tts.start(), return_exceptions=True)
+        except BaseException:
+            await self.stop()
+            raise
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # The service that did start holds a pooled connection; stop() hands it back
+            await self.stop()
+            raise errors[0]
+
+        try:
+            while self.is_running:
+                try:
+                    message = await self.websocket.receive()
+                except (WebSocketDisconnect, WebSocketException):
+                    logger.info("Client disconnected")
+                    break
+                except BaseException as e:
+                    logger.error(f"Error receiving data: {e}")
+                    break
+
+                if message["type"] == "websocket.disconnect":
+                    logger.info("Client disconnected")
+                    break
+
+                # Audio arrives as raw binary PCM frames and is forwarded to STT without decoding;
+                # text frames carry control messages, which are not handled yet
+                audio = message.get("bytes")
+                if audio:
+                    await self.stt.add_audio_chunk(audio)
+        finally:
+            await self.stop()
 
     async def stop(self):
         self.is_running = False
-        await self.turn_taking_manager.reset()
-        await self.stt.stop()
-        await self.tts.stop()
+        if self.speculative_task:
+            await self._cancel_speculation()
+        if self.tx_flush_handle:
+            self.tx_flush_handle.cancel()
+            self.tx_flush_handle = None
+        self.tx_buffer.clear()
+        self.turn_taking_manager.reset()
+        # Both drain their connections before returning them to the pool, so stop them together
+        await asyncio.gather(self.stt.stop(), self.tts.stop())
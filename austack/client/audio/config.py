@@ -1,3 +1,4 @@
+import warnings
 from dataclasses import dataclass
 from typing import Optional
 import pyaudio
@@ -24,7 +25,16 @@ class AudioStreamConfig:
     # Voice activity detection parameters
     silence_threshold: float = 0.01
     silence_timeout: float = 2.0
-    send_interval: float = 0.5
+    # Deprecated and ignored; input audio is now streamed chunk by chunk
+    send_interval: Optional[float] = None
+
+    # Optional Silero VAD ONNX model; WebRTC VAD is used when unset
+    vad_model_path: Optional[str] = None
+
+    def __post_init__(self):
+        if self.send_interval is not None:
+            # Points at the caller constructing the dataclass directly; the factories warn themselves and don't forward it
+            warnings.warn("send_interval is deprecated and has no effect", DeprecationWarning, stacklevel=3)
 
 
 @dataclass
@@ -52,11 +62,14 @@ class AudioConfig:
         chunk_size: int = 1024,
         silence_threshold: float = 0.01,
         silence_timeout: float = 2.0,
-        send_interval: float = 0.5,
+        send_interval: Optional[float] = None,
         input_device_index: Optional[int] = None,
         output_device_index: Optional[int] = None,
+        vad_model_path: Optional[str] = None,
     ) -> "AudioConfig":
         """Create custom audio configuration with specified parameters."""
+        if send_interval is not None:
+            warnings.warn("send_interval is deprecated and has no effect", DeprecationWarning, stacklevel=2)
         stream_config = AudioStreamConfig(
             input_chunk_size=chunk_size,
             input_sample_rate=input_sample_rate,
@@ -67,6 +80,6 @@ class AudioConfig:
             output_device_index=output_device_index,
             silence_threshold=silence_threshold,
             silence_timeout=silence_timeout,
-            send_interval=send_interval,
+            vad_model_path=vad_model_path,
         )
         return cls(stream=stream_config)
@@ -1,6 +1,7 @@
 import logging
-import queue
+import math
 import threading
+from collections import deque
 import time
 from typing import Optional, Callable
 
@@ -9,6 +10,7 @@ import pyaudio
 import webrtcvad
 
 from .config import AudioConfig, AudioStreamConfig
+from .vad import SileroVAD
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,9 @@ logger = logging.getLogger(__name__)
 class AudioInterface:
     """Generalized audio interface for handling input/output streams with voice activity detection."""
 
+    # Played audio is dropped from the front of the output buffer once this many bytes have been consumed
+    OUTPUT_COMPACT_SIZE = 64 * 1024
+
     def __init__(
         self,
         input_callback: Callable[[bytes], None],
@@ -38,89 +43,111 @@ class AudioInterface:
         self.output_stream: Optional[pyaudio.Stream] = None
 
         # Threading components
-        self.input_queue: queue.Queue[bytes] = queue.Queue()
-        self.output_queue: queue.Queue[bytes] = queue.Queue()
+        # Single producer/consumer deque; append/popleft are atomic so the event only signals wakeups
+        self.input_queue: deque[bytes] = deque(maxlen=64)
+        self.input_event = threading.Event()
         self.is_running = False
         self.input_thread: Optional[threading.Thread] = None
-        self.output_thread: Optional[threading.Thread] = None
+
+        # Playback buffer drained by the PortAudio output callback; play() appends, the callback advances the read offset
+        self.output_buffer = bytearray()
+        self.output_offset = 0
+        self.output_lock = threading.Lock()
+        self._output_frame_bytes = self._frame_bytes()
 
         # Voice activity detection
         self.vad = webrtcvad.Vad()
         self.vad.set_mode(1)
+        self._vad_frame_size = 480 * 2  # 30ms at 16kHz, 16-bit
+        self._vad_pad = bytearray(self._vad_frame_size)
+        self._vad_silence = bytes(self._vad_frame_size)
+        self.silero_vad: Optional[SileroVAD] = None
+        if self.stream_config.vad_model_path:
+            self.silero_vad = SileroVAD(self.stream_config.vad_model_path, self.stream_config.input_sample_rate)
+        self._silence_threshold_int = int(self.stream_config.silence_threshold * 32768)
+        self._silence_timeout_ns = int(self.stream_config.silence_timeout * 1e9)
 
         # State tracking
-        self.last_speech_time = None
-        self.audio_buffer: list[bytes] = []
-        self.last_send_time = time.time()
+        self.last_speech_time_ns: Optional[int] = None
         self.was_sending_audio = False
 
+    def _frame_bytes(self) -> int:
+        """Bytes per output frame for the configured sample format and channel count."""
+        return pyaudio.get_sample_size(self.stream_config.format) * self.stream_config.output_channels
+
     def calculate_rms(self, audio_data: bytes) -> float:
         """Calculate RMS (Root Mean Square) of audio data."""
         try:
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            audio_float = audio_array.astype(np.float32) / 32768.0
-            rms = np.sqrt(np.mean(audio_float**2))
-            return rms
+            # Accumulate the sum of squares in int64; int16 dot products would overflow
+            samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.int64)
+            return math.sqrt(np.dot(samples, samples) / samples.size) / 32768.0
         except Exception:
             return 0.0
 
     def is_speech(self, frame: bytes, sample_rate: int) -> bool:
-        """Check if frame contains speech using both RMS and WebRTC VAD."""
-        # First check RMS - if too quiet, definitely not speech
-        rms = self.calculate_rms(frame)
-        if rms < self.stream_config.silence_threshold:
+        """Check if frame contains speech with Silero VAD, or with a peak gate and then WebRTC VAD on 30ms subframes."""
+        samples = np.frombuffer(frame, dtype=np.int16)
+        if samples.size == 0:
             return False
 
-        # If loud enough, use WebRTC VAD for better detection
         try:
-            # WebRTC VAD requires specific frame lengths
-            frame_size = 480 * 2  # 30ms at 16kHz, 16-bit
-            if len(frame) >= frame_size:
-                chunk = frame[:frame_size]
-                return self.vad.is_speech(chunk, sample_rate)
-            else:
-                # If frame too small, pad it
-                padded_frame = frame + b"\x00" * (frame_size - len(frame))
-                return self.vad.is_speech(padded_frame[:frame_size], sample_rate)
+            if self.silero_vad is not None:
+                # Silero's recurrent state assumes contiguous audio, so it sees every chunk, quiet ones included
+                return self.silero_vad.is_speech(samples)
+        except Exception:
+            return self.calculate_rms(frame) > self.stream_config.silence_threshold * 2
+
+        # First check the peak amplitude - if too quiet, definitely not speech
+        peak = max(int(samples.max()), -int(samples.min()))
+        if peak < self._silence_threshold_int:
+            return False
+
+        try:
+            # If loud enough, use WebRTC VAD on every full 30ms subframe of the chunk
+            frame_size = self._vad_frame_size
+            length = len(frame)
+            if length < frame_size:
+                # If frame too small, pad it in the preallocated buffer
+                self._vad_pad[:length] = frame
+                self._vad_pad[length:] = memoryview(self._vad_silence)[length:]
+                return self.vad.is_speech(self._vad_pad, sample_rate)
+
+            view = memoryview(frame)
+            for start in range(0, length - frame_size + 1, frame_size):
+                if self.vad.is_speech(view[start : start + frame_size], sample_rate):
+                    return True
+            return False
         except Exception:
             # Fallback to RMS-based detection
-            return rms > self.stream_config.silence_threshold * 2
+            return self.calculate_rms(frame) > self.stream_config.silence_threshold * 2
 
-    def should_send_audio(self) -> bool:
+    def should_send_audio(self, now_ns: Optional[int] = None) -> bool:
         """Determine if audio should be sent based on recent speech activity."""
-        if self.last_speech_time is None:
+        if self.last_speech_time_ns is None:
             return False
 
-        time_since_speech = time.time() - self.last_speech_time
-        return time_since_speech < self.stream_config.silence_timeout
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns - self.last_speech_time_ns < self._silence_timeout_ns
 
     def _input_callback(self, in_data: bytes, *_, **__):
         """PyAudio input stream callback."""
         if not self.is_running:
             return (None, pyaudio.paContinue)
 
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
 
         # Check for speech
         if self.is_speech(in_data, self.stream_config.input_sample_rate):
-            self.last_speech_time = current_time
-
-        # Always buffer audio if we've heard speech recently
-        if self.should_send_audio():
-            self.audio_buffer.append(in_data)
-
-        # Send batched audio periodically
-        if current_time - self.last_send_time >= self.stream_config.send_interval and self.audio_buffer and self.should_send_audio():
-            # Combine buffered audio and send
-            combined_audio = b"".join(self.audio_buffer)
-            self.input_queue.put_nowait(combined_audio)
+            self.last_speech_time_ns = now_ns
 
-            # Reset buffer and timer
-            self.audio_buffer = []
-            self.last_send_time = current_time
+        # Forward every chunk while we've heard speech recently; the STT service does its own buffering
+        current_should_send = self.should_send_audio(now_ns)
+        if current_should_send:
+            self.input_queue.append(in_data)
+            self.input_event.set()
 
         # Track audio state
-        current_should_send = self.should_send_audio()
         self.was_sending_audio = current_should_send
 
         return (None, pyaudio.paContinue)
@@ -128,34 +155,49 @@ class AudioInterface:
     def _process_input_queue(self):
         """Process audio input queue in separate thread."""
         while self.is_running:
-            try:
-                audio_data = self.input_queue.get(timeout=0.1)
-
-                # Send audio data via callback
-                logger.info(f"Sending {len(audio_data)} bytes of audio")
-                self.input_callback(audio_data)
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.info(f"Error processing input audio: {e}")
+            if not self.input_event.wait(timeout=0.1):
                 continue
+            self.input_event.clear()
+
+            while self.input_queue:
+                try:
+                    audio_data = self.input_queue.popleft()
+
+                    # Send audio data via callback
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Sending %d bytes of audio", len(audio_data))
+                    self.input_callback(audio_data)
+                except Exception as e:
+                    logger.info(f"Error processing input audio: {e}")
+                    continue
+
+    def _output_callback(self, _in_data, frame_count: int, *_, **__):
+        """PyAudio output stream callback, pads with silence when no audio is buffered."""
+        size = frame_count * self._output_frame_bytes
+        with self.output_lock:
+            end = min(self.output_offset + size, len(self.output_buffer))
+            with memoryview(self.output_buffer) as view:
+                audio_data = bytes(view[self.output_offset : end])
+
+            if end == len(self.output_buffer):
+                self.output_buffer.clear()
+                self.output_offset = 0
+            elif end >= self.OUTPUT_COMPACT_SIZE:
+                del self.output_buffer[:end]
+                self.output_offset = 0
+            else:
+                self.output_offset = end
 
-    def _process_output_queue(self):
-        """Process audio output queue in separate thread."""
-        while self.is_running:
-            try:
-                audio_data = self.output_queue.get(timeout=0.1)
-                if self.output_stream:
-                    self.output_stream.write(audio_data)
-
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.info(f"Error playing audio: {e}")
-                continue
+        if len(audio_data) < size:
+            audio_data += bytes(size - len(audio_data))
+        return (audio_data, pyaudio.paContinue)
 
     def start(self):
         """Start the audio interface streams and processing threads."""
+        if self.silero_vad is not None:
+            # Recurrent state left over from a previous conversation must not bias the first windows of this one
+            self.silero_vad.reset()
+
         try:
             # Start input stream
             self.input_stream = self.audio.open(
@@ -176,17 +218,16 @@ class AudioInterface:
                 rate=self.stream_config.output_sample_rate,
                 output=True,
                 output_device_index=self.stream_config.output_device_index,
+                frames_per_buffer=self.stream_config.input_chunk_size,
+                stream_callback=self._output_callback,  # type: ignore
                 start=True,
             )
 
             self.is_running = True
 
-            # Start processing threads
+            # Start processing thread
             self.input_thread = threading.Thread(target=self._process_input_queue, daemon=True)
-            self.output_thread = threading.Thread(target=self._process_output_queue, daemon=True)
-
             self.input_thread.start()
-            self.output_thread.start()
 
         except Exception:
             raise
@@ -194,7 +235,8 @@ class AudioInterface:
     def play(self, audio_data: bytes):
         """Queue audio data for playback."""
         if self.is_running:
-            self.output_queue.put(audio_data)
+            with self.output_lock:
+                self.output_buffer += audio_data
 
     def stop(self):
         """Stop the audio interface and clean up resources."""
@@ -210,11 +252,13 @@ class AudioInterface:
             self.output_stream.close()
             self.output_stream = None
 
-        # Wait for threads to finish
+        with self.output_lock:
+            self.output_buffer.clear()
+            self.output_offset = 0
+
+        # Wait for thread to finish
         if self.input_thread:
             self.input_thread.join(timeout=1.0)
-        if self.output_thread:
-            self.output_thread.join(timeout=1.0)
 
     def cleanup(self):
         """Clean up all resources."""
@@ -225,3 +269,6 @@ class AudioInterface:
         """Update audio configuration. Note: requires restart to take effect."""
         self.config = audio_config
         self.stream_config = self.config.stream
+        self._silence_threshold_int = int(self.stream_config.silence_threshold * 32768)
+        self._silence_timeout_ns = int(self.stream_config.silence_timeout * 1e9)
+        self._output_frame_bytes = self._frame_bytes()
@@ -0,0 +1,54 @@
+import numpy as np
+
+
+class SileroVAD:
+    """Silero voice activity detection running on ONNX Runtime."""
+
+    SPEECH_THRESHOLD = 0.5
+
+    def __init__(self, model_path: str, sample_rate: int = 16000):
+        """
+        Load a Silero VAD ONNX model (fp32 or int8 quantized).
+
+        Args:
+            model_path: Path to the Silero VAD v5 ``.onnx`` file
+            sample_rate: Input sample rate, 8000 or 16000 Hz
+        """
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("Silero VAD requires onnxruntime: pip install 'austack[silero]'") from e
+
+        if sample_rate not in (8000, 16000):
+            raise ValueError(f"Silero VAD supports 8000 or 16000 Hz, got {sample_rate}")
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+        self.sample_rate = np.array(sample_rate, dtype=np.int64)
+        self.window_samples = 512 if sample_rate == 16000 else 256
+        self.context_samples = 64 if sample_rate == 16000 else 32
+        self.reset()
+
+    def reset(self):
+        """Clear the recurrent state and any buffered samples."""
+        self.state = np.zeros((2, 1, 128), dtype=np.float32)
+        self.context = np.zeros((1, self.context_samples), dtype=np.float32)
+        self.pending = np.zeros(0, dtype=np.float32)
+
+    def is_speech(self, samples: np.ndarray) -> bool:
+        """Return True if any complete window in the int16 samples is classified as speech."""
+        audio = np.concatenate((self.pending, samples.astype(np.float32) / 32768.0))
+        usable = audio.size - audio.size % self.window_samples
+        self.pending = audio[usable:]
+
+        speech = False
+        for window in audio[:usable].reshape(-1, self.window_samples):
+            # The model must see every window to keep its recurrent state, so there is no early exit
+            model_input = np.concatenate((self.context, window[np.newaxis, :]), axis=1)
+            probability, self.state = self.session.run(None, {"input": model_input, "state": self.state, "sr": self.sample_rate})
+            self.context = model_input[:, -self.context_samples :]
+            speech = speech or float(probability[0][0]) >= self.SPEECH_THRESHOLD
+        return speech
@@ -1,9 +1,13 @@
+import asyncio
 import json
 import logging
-import time
-from typing import Optional
+import warnings
+from typing import Optional, Union
 
-import websocket
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
+
+from austack.core.base import AUDIO_SUBPROTOCOL
 
 from .audio.interface import AudioInterface
 from .audio.config import AudioConfig
@@ -37,7 +41,12 @@ class ConversationClient:
         self.running = False
         self.connection_timeout = connection_timeout
         self.audio_config = audio_config or AudioConfig.create_default()
-        self.websocket = None
+        self.websocket: Optional[ClientConnection] = None
+
+        # Created on the conversation's event loop; the audio thread reaches them via call_soon_threadsafe
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.send_queue: Optional[asyncio.Queue[Union[bytes, str]]] = None
+        self.stop_event: Optional[asyncio.Event] = None
 
         self.audio_interface = AudioInterface(
             input_callback=self._on_audio_input,
@@ -51,45 +60,41 @@ class ConversationClient:
     def _on_audio_received(self, audio_data: bytes):
         self.audio_interface.play(audio_data)
 
-    def connect(self):
+    async def connect(self):
         if self.websocket:
             return
 
         try:
-            self.websocket = websocket.create_connection(self.websocket_url, timeout=self.connection_timeout, enable_multithread=True)
-            # Set a shorter timeout for recv() operations
-            self.websocket.settimeout(0.1)
-
+            self.websocket = await connect(
+                self.websocket_url,
+                open_timeout=self.connection_timeout,
+                subprotocols=[AUDIO_SUBPROTOCOL],  # type: ignore
+            )
             logger.info(f"Connected to WebSocket: {self.websocket_url}")
         except Exception as e:
             logger.info(f"Error connecting to websocket: {e}")
             raise
 
+    def _enqueue(self, message: Union[bytes, str]) -> bool:
+        """Hand a message to the send loop. Safe to call from any thread."""
+        if not self.websocket or not self.running or not self.loop or not self.send_queue:
+            return False
+
+        try:
+            self.loop.call_soon_threadsafe(self.send_queue.put_nowait, message)
+        except RuntimeError:
+            # Event loop already closed
+            return False
+        return True
+
     def send_audio_data(self, audio_data: bytes):
         """Send audio data over WebSocket."""
-        if not self.websocket or not self.running:
+        if not self._enqueue(audio_data):
             logger.info("Cannot send audio: WebSocket not connected")
-            return
-
-        try:
-            self.websocket.send(audio_data, opcode=websocket.ABNF.OPCODE_BINARY)
-        except websocket.WebSocketConnectionClosedException:
-            logger.info("Cannot send audio: WebSocket connection closed")
-        except Exception as e:
-            logger.info(f"Error sending audio data: {e}")
 
     def send_message(self, message: dict):
-        if not self.websocket or not self.running:
+        if not self._enqueue(json.dumps(message)):
             logger.info("Cannot send message: WebSocket not connected")
-            return
-
-        try:
-            message_str = json.dumps(message)
-            self.websocket.send(message_str)
-        except websocket.WebSocketConnectionClosedException:
-            logger.info("Cannot send message: WebSocket connection closed")
-        except Exception as e:
-            logger.info(f"Error sending message: {e}")
 
     def send_stop_speaking_signal(self):
         self.send_message({"type": "on_user_stop_speaking"})
@@ -97,42 +102,74 @@ class ConversationClient:
     def disconnect(self):
         self.running = False
 
-        if self.websocket:
+        if self.loop and self.stop_event:
             try:
-                self.websocket.close()
-            except Exception:
+                self.loop.call_soon_threadsafe(self.stop_event.set)
+            except RuntimeError:
                 pass
-            self.websocket = None
 
-    def start_conversation(self):
+    async def _send_loop(self):
+        """Send queued audio and messages until the connection closes."""
+        while True:
+            message = await self.send_queue.get()  # type: ignore
+            try:
+                await self.websocket.send(message)  # type: ignore
+            except ConnectionClosed:
+                logger.info("Cannot send data: WebSocket connection closed")
+                return
+            except Exception as e:
+                logger.info(f"Error sending data: {e}")
+
+    async def _recv_loop(self):
+        """Receive messages from the WebSocket until the connection closes."""
+        try:
+            async for message in self.websocket:  # type: ignore
+                if isinstance(message, bytes):
+                    self._on_audio_received(message)
+                else:
+                    try:
+                        data = json.loads(message)
+                        logger.info(f"Received message: {data}")
+                    except json.JSONDecodeError:
+                        logger.info(f"Received non-JSON text message: {message}")
+        except ConnectionClosed:
+            pass
+
+    async def run_conversation(self):
+        """Run a conversation on the current event loop until the connection closes or disconnect() is called."""
+        self.loop = asyncio.get_running_loop()
+        self.send_queue = asyncio.Queue()
+        self.stop_event = asyncio.Event()
+
+        await self.connect()
         try:
-            self.connect()
             self.audio_interface.start()
 
             self.running = True
             logger.info(f"Conversation started with {self.websocket_url}")
             logger.info("Press Ctrl+C to stop the conversation")
 
-            while self.running:
-                try:
-                    message = self.websocket.recv()
-                    if isinstance(message, bytes):
-                        self._on_audio_received(message)
-                    elif isinstance(message, str):
-                        try:
-                            data = json.loads(message)
-                            logger.info(f"Received message: {data}")
-                        except json.JSONDecodeError:
-                            logger.info(f"Received non-JSON text message: {message}")
-                except websocket.WebSocketTimeoutException:
-                    break
-                except websocket.WebSocketConnectionClosedException:
-                    self.running = False
-                except ConnectionResetError:
-                    self.running = False
-                except Exception as e:
-                    logger.info(f"Error during conversation: {e}")
+            tasks = [
+                asyncio.create_task(self._recv_loop()),
+                asyncio.create_task(self._send_loop()),
+                asyncio.create_task(self.stop_event.wait()),
+            ]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.running = False
+            self.audio_interface.stop()
+            if self.websocket:
+                await self.websocket.close()
+                self.websocket = None
 
+    def start_conversation(self):
+        try:
+            asyncio.run(self.run_conversation())
         except KeyboardInterrupt:
             logger.info("\nKeyboard interrupt - stopping conversation")
         except Exception as e:
@@ -159,11 +196,14 @@ class ConversationClient:
         chunk_size: int = 1024,
         silence_threshold: float = 0.01,
         silence_timeout: float = 2.0,
-        send_interval: float = 0.5,
+        send_interval: Optional[float] = None,
         input_device_index: Optional[int] = None,
         output_device_index: Optional[int] = None,
         connection_timeout: int = 10,
+        vad_model_path: Optional[str] = None,
     ) -> "ConversationClient":
+        if send_interval is not None:
+            warnings.warn("send_interval is deprecated and has no effect", DeprecationWarning, stacklevel=2)
         audio_config = AudioConfig.create_custom(
             input_sample_rate=input_sample_rate,
             output_sample_rate=output_sample_rate,
@@ -172,9 +212,9 @@ class ConversationClient:
             chunk_size=chunk_size,
             silence_threshold=silence_threshold,
             silence_timeout=silence_timeout,
-            send_interval=send_interval,
             input_device_index=input_device_index,
             output_device_index=output_device_index,
+            vad_model_path=vad_model_path,
         )
 
         return cls(
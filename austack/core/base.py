@@ -5,6 +5,10 @@ import time
 from dataclasses import dataclass
 
 
+# WebSocket subprotocol for raw 16-bit PCM audio frames between client and server
+AUDIO_SUBPROTOCOL = "austack-audio-pcm16"
+
+
 class TranscriptionState(Enum):
     GENERATING = "generating"
     PROBABLY_FINAL = "probably_final"
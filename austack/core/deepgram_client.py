@@ -0,0 +1,11 @@
+import os
+from functools import lru_cache
+
+from deepgram import DeepgramClient, DeepgramClientOptions
+
+
+@lru_cache(maxsize=None)
+def get_deepgram_client(keepalive: bool = False) -> DeepgramClient:
+    """Return a process-wide Deepgram client, created on first use from DEEPGRAM_API_KEY."""
+    config = DeepgramClientOptions(options={"keepalive": "true"}) if keepalive else None
+    return DeepgramClient(os.getenv("DEEPGRAM_API_KEY", ""), config)
@@ -1,6 +1,8 @@
 import asyncio
+import functools
 import logging
-from .baml_client import b
+from collections import deque
+from .baml_client.async_client import b
 from .baml_client.types import ConversationalAgentInput, ConversationHistory
 from austack.core.base import AbstractLLMBase
 from typing_extensions import Protocol
@@ -13,77 +15,151 @@ class OnGenerateResponseProtocol(Protocol):
 
 
 class BamlLLMManager(AbstractLLMBase):
-    STOP_CHARS = [".", "?", "!"]
+    STOP_CHARS = (".", "?", "!")
+    STOP_SET = frozenset(STOP_CHARS)
+    CLOSING_CHARS = frozenset("\"')]")
+    # Only the most recent messages are kept and sent with each request
+    MAX_HISTORY = 20
+    # After the first sentence, short sentences are grouped until at least this many characters before on_sentence is called
+    MIN_SENTENCE_CHARS = 40
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = "Only answer in one short coherent sentence."
-        self.conversation_history: list[ConversationHistory] = []
+        # The system prompt is the same for every turn, so bind it once
+        self.make_input = functools.partial(ConversationalAgentInput, system_prompt=self.prompt)
+        self.conversation_history: deque[ConversationHistory] = deque(maxlen=self.MAX_HISTORY)
         self.current_stream = None
         self.generated_sentences = []
         self.generating = False
+        self.sentence_tasks: list[asyncio.Task] = []
+        self.turn_messages = 0
+
+    @classmethod
+    async def prewarm(cls):
+        """Send one tiny request so the LLM client's connection is set up before the first session."""
+        manager = cls()
+        await b.GenerateResponse(input=manager.make_input(conversation_history=[], user_message="Hi"))
+
+    def ends_sentence(self, delta: str) -> bool:
+        """Check whether a streamed delta ends a sentence, allowing one closing quote or bracket after the stop char."""
+        tail = delta.rstrip()[-2:]
+        last = tail[-1:]
+        return last in self.STOP_SET or (last in self.CLOSING_CHARS and tail[:1] in self.STOP_SET)
 
     def add_to_conversation_history(self, text: str, role: str):
         self.conversation_history.append(ConversationHistory(role=role, content=text))
+        self.turn_messages += 1
 
     async def generate_response(self, prompt: str):
         logger.debug(
             "LLM generate_response override handler called",
             extra={"handler": "generate_response", "prompt_length": len(prompt), "prompt": prompt},
         )
+        self.turn_messages = 0
         self.add_to_conversation_history(prompt, "user")
 
-        logger.info("Current conversation history:")
-        for message in self.conversation_history:
-            logger.info(f"{message.role}: {message.content}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current conversation history:")
+            for message in self.conversation_history:
+                logger.debug("%s: %s", message.role, message.content)
 
         self.generated_sentences = []
         self.generating = True
-        self.current_stream = b.stream.GenerateResponse(
-            input=ConversationalAgentInput(
-                conversation_history=self.conversation_history,
-                system_prompt=self.prompt,
+        stream = b.stream.GenerateResponse(
+            input=self.make_input(
+                conversation_history=list(self.conversation_history),
                 user_message=prompt,
             )
         )
+        self.current_stream = stream
+        # BAML yields the cumulative partial response, so only the text past current_index is new
         current_index = 0
-        current_sentence = ""
-
-        for chunk in self.current_stream:
-            if not self.generating:
+        sentence_parts: list[str] = []
+        sentence_chars = 0
+        sentence_tasks: list[asyncio.Task] = []
+        self.sentence_tasks = sentence_tasks
+
+        try:
+            async for chunk in stream:
+                # Stop if interrupted, or if a newer generation replaced this one
+                if not self.generating or self.current_stream is not stream:
+                    return
+
+                # Partials can be None before the first token arrives
+                if not chunk or len(chunk) <= current_index:
+                    continue
+
+                delta = chunk[current_index:]
+                current_index = len(chunk)
+                sentence_parts.append(delta)
+                sentence_chars += len(delta)
+                # The first sentence goes out as soon as it ends so a short opener doesn't delay the first audio
+                if (sentence_chars >= self.MIN_SENTENCE_CHARS or not self.generated_sentences) and self.ends_sentence(delta):
+                    self._dispatch_sentence("".join(sentence_parts), sentence_tasks)
+                    sentence_parts.clear()
+                    sentence_chars = 0
+
+            # Whatever is left (a short last sentence or text without a stop char) still gets spoken
+            remainder = "".join(sentence_parts)
+            if remainder.strip():
+                self._dispatch_sentence(remainder, sentence_tasks)
+
+            # interrupt() cancels these, so exceptions are collected rather than raised here
+            await asyncio.gather(*sentence_tasks, return_exceptions=True)
+            if not self.generating or self.current_stream is not stream:
                 return
+        finally:
+            # Interrupted, superseded or cancelled: sentences not yet handed to on_sentence are dropped
+            await self._cancel_sentence_tasks(sentence_tasks)
 
-            end = len(chunk)
-            if current_index == end:
-                continue
-
-            current_sentence += chunk[current_index:]
-            if current_sentence.strip().endswith(tuple(self.STOP_CHARS)):
-                self.generated_sentences.append(current_sentence)
-                if self.on_sentence:
-                    logger.debug(
-                        "LLM on_sentence callback invoked",
-                        extra={"sentence_length": len(current_sentence)},
-                    )
-                    await self.on_sentence(current_sentence)
-                current_sentence = ""
-            current_index = end
-
-        final = self.current_stream.get_final_response()
+        final = await stream.get_final_response()
         self.add_to_conversation_history(final, "assistant")
         if self.on_full_response:
             logger.debug("LLM on_full_response callback invoked", extra={"response_length": len(final)})
             await self.on_full_response(final)
 
+    @staticmethod
+    async def _cancel_sentence_tasks(sentence_tasks: list[asyncio.Task]):
+        pending = [task for task in sentence_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _dispatch_sentence(self, sentence: str, sentence_tasks: list[asyncio.Task]):
+        self.generated_sentences.append(sentence)
+        if self.on_sentence:
+            logger.debug(
+                "LLM on_sentence callback invoked",
+                extra={"sentence_length": len(sentence)},
+            )
+            previous = sentence_tasks[-1] if sentence_tasks else None
+            sentence_tasks.append(asyncio.create_task(self._emit_sentence(sentence, previous)))
+
+    async def _emit_sentence(self, sentence: str, previous: asyncio.Task | None):
+        # Sentences must reach on_sentence in order even though they are dispatched as tasks
+        if previous is not None:
+            await asyncio.wait([previous])
+        await self.on_sentence(sentence)  # type: ignore
+
     async def interrupt(self, save_in_conversation: bool = True):
         logger.debug(f"LLM interrupted, save_in_conversation={save_in_conversation}")
         self.generating = False
+        # Sentences already dispatched would otherwise keep reaching on_sentence after a barge-in
+        for task in self.sentence_tasks:
+            task.cancel()
 
         if save_in_conversation and self.generated_sentences:
             # Save partial response to conversation history
             partial_response = " ".join(self.generated_sentences) + " (interrupted)"
             self.add_to_conversation_history(partial_response, "assistant")
             logger.debug(f"Saved interrupted response: {partial_response}")
+        elif not save_in_conversation:
+            # Discard the whole exchange, including the prompt, e.g. for an abandoned speculative response
+            for _ in range(min(self.turn_messages, len(self.conversation_history))):
+                self.conversation_history.pop()
+            self.turn_messages = 0
 
         # Clear state
         self.generated_sentences = []
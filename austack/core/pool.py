@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledConnection:
+    """A websocket connection kept open between sessions, with the manager currently using it."""
+
+    connection: Any
+    created_at: float = field(default_factory=time.monotonic)
+    owner: Any = None
+    # Bumped each time a manager claims the connection, so events dispatched for an earlier owner can be dropped
+    generation: int = 0
+
+    def claim(self, owner: Any) -> int:
+        """Make owner the recipient of this connection's events and return the new generation."""
+        self.generation += 1
+        self.owner = owner
+        return self.generation
+
+    def owner_for(self, generation: int) -> Any:
+        """Return the current owner if it claimed the connection in the given generation, otherwise None."""
+        return self.owner if generation == self.generation else None
+
+    def dispatch(self, method: str, *args: Any, generation: Optional[int] = None) -> Awaitable[None]:
+        """
+        Forward an event to a method of the owner.
+
+        Call this synchronously from the connection's event handler. The event is then stamped with the generation
+        at dispatch time, or with the given generation, and is dropped if another owner has claimed the connection.
+        """
+        return self._deliver(self.generation if generation is None else generation, method, args)
+
+    async def _deliver(self, generation: int, method: str, args: tuple):
+        owner = self.owner_for(generation)
+        if owner:
+            await getattr(owner, method)(*args)
+
+
+class ConnectionPool:
+    """Keeps released Deepgram websocket connections open so later sessions skip the connection handshake."""
+
+    CONNECT_TIMEOUT = 10.0
+
+    def __init__(self, name: str, max_idle: int = 4, max_age: float = 300.0):
+        self.name = name
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.idle: list[PooledConnection] = []
+
+    def _is_fresh(self, pooled: PooledConnection) -> bool:
+        return time.monotonic() - pooled.created_at < self.max_age
+
+    async def open(self, pooled: PooledConnection, open_event: Any, options: Any) -> PooledConnection:
+        """Start a new connection and wait for its Open event, closing it if either step fails."""
+        opened = asyncio.Event()
+
+        async def on_open(*_, **__):
+            opened.set()
+
+        pooled.connection.on(open_event, on_open)
+        if not await pooled.connection.start(options):
+            # Open is only emitted once the socket connects, so waiting for it would just run out the timeout
+            await self.close(pooled)
+            raise Exception(f"Failed to start Deepgram {self.name} connection")
+
+        try:
+            await asyncio.wait_for(opened.wait(), timeout=self.CONNECT_TIMEOUT)
+        except BaseException:
+            # Not pooled yet, so nothing else would close it
+            await self.close(pooled)
+            raise
+        return pooled
+
+    async def acquire(self) -> Optional[PooledConnection]:
+        """Return the most recently released live connection, or None if a new one must be opened."""
+        while self.idle:
+            pooled = self.idle.pop()
+            if self._is_fresh(pooled) and await pooled.connection.is_connected():
+                return pooled
+            await self.close(pooled)
+        return None
+
+    async def release(self, pooled: PooledConnection):
+        """
+        Return a connection to the pool, or close it if the pool is full or the connection is stale.
+
+        The caller must have drained the connection first, so no event from its session can reach the next owner.
+        """
+        pooled.owner = None
+        if len(self.idle) < self.max_idle and self._is_fresh(pooled) and await pooled.connection.is_connected():
+            self.idle.append(pooled)
+            return
+        await self.close(pooled)
+
+    async def fill(self, connect: Callable[[], Awaitable[PooledConnection]], count: int):
+        """Open connections concurrently until at least count are idle, so the first sessions skip the handshake."""
+        missing = min(count, self.max_idle) - len(self.idle)
+        if missing <= 0:
+            return
+
+        results = await asyncio.gather(*(connect() for _ in range(missing)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, PooledConnection):
+                await self.release(result)
+            else:
+                logger.error(f"Error prewarming connection: {result}")
+
+    async def close(self, pooled: PooledConnection):
+        pooled.owner = None
+        try:
+            await pooled.connection.finish()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+
+class PooledManager:
+    """Mixin for managers whose connections come from a pool shared by every instance of the class."""
+
+    connection_pool: ConnectionPool
+
+    async def _connect(self) -> PooledConnection:
+        """Open a new connection whose event handlers forward to whichever manager currently owns it."""
+        raise NotImplementedError
+
+    async def _acquire_connection(self) -> PooledConnection:
+        pooled = await self.connection_pool.acquire()
+        if pooled is None:
+            pooled = await self._connect()
+        return pooled
+
+    @classmethod
+    async def prewarm(cls, count: int = 1):
+        """Open idle connections ahead of the first session."""
+        await cls.connection_pool.fill(lambda: cls()._connect(), count)
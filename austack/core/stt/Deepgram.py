@@ -1,123 +1,287 @@
-import os
 import asyncio
 import logging
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Any
 import time
 
-import dotenv
 from deepgram import (
-    DeepgramClient,
-    DeepgramClientOptions,
     LiveOptions,
     LiveTranscriptionEvents,
 )
 
 from typing_extensions import Protocol
 from austack.core.base import AsyncSpeechToTextBase
-
-dotenv.load_dotenv()
+from austack.core.deepgram_client import get_deepgram_client
+from austack.core.pool import ConnectionPool, PooledConnection, PooledManager
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _ListenConnection(PooledConnection):
+    """A pooled listen connection that tracks the audio timeline Deepgram timestamps its events on."""
+
+    # Seconds of audio sent on the connection, and how far Deepgram's results have caught up with it
+    sent_seconds: float = 0.0
+    transcribed_seconds: float = 0.0
+    # Where the current owner's audio starts on the timeline
+    owner_start: float = 0.0
+    progress: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def claim(self, owner: Any) -> int:
+        self.owner_start = self.sent_seconds
+        return super().claim(owner)
+
+    def generation_at(self, position: float, inclusive: bool = False) -> int:
+        """Return the generation whose audio covers this point of the timeline."""
+        owned = position >= self.owner_start if inclusive else position > self.owner_start
+        return self.generation if owned else self.generation - 1
+
+    def mark_transcribed(self, position: float):
+        self.transcribed_seconds = max(self.transcribed_seconds, position)
+        self.progress.set()
+
+
 class OnTranscriptProtocol(Protocol):
     def __call__(self, transcript: str) -> None: ...
 
 
-class DeepgramSpeechToTextManager(AsyncSpeechToTextBase):
-    def __init__(self, **kwargs):
+class DeepgramSpeechToTextManager(PooledManager, AsyncSpeechToTextBase):
+    connection_pool = ConnectionPool("STT")
+    SAMPLE_RATE = 16000
+    # Audio is batched into sends of about this many seconds of linear16 mono
+    SEND_INTERVAL = 0.2
+    # Interim transcripts closer together than this are dropped unless they add enough new text
+    PARTIAL_MIN_INTERVAL = 0.05
+    PARTIAL_MIN_NEW_CHARS = 8
+    # Seconds of audio allowed to wait behind a stalled send before new batches are dropped
+    MAX_BACKLOG = 3.0
+    # How long stop() waits for Deepgram to finish transcribing before the connection is closed instead of pooled
+    DRAIN_TIMEOUT = 2.0
+    # Results may end slightly short of the audio sent, e.g. on a partial trailing frame
+    DRAIN_TOLERANCE = 0.05
+
+    def __init__(self, emit_partials: bool = True, **kwargs):
         super().__init__(**kwargs)
-        self.audio_queue = asyncio.Queue()
+        self.emit_partials = emit_partials
+        self.last_partial = ""
+        self.last_partial_time = 0.0
         self.is_running = False
         self.current_sentence = ""
-        self.process_audio_task = None
+        self.dg_connection = None
+        # Audio received before the connection is ready; sent in order once start() completes
+        self.pending_audio: deque[bytes] = deque(maxlen=50)
+        self.send_lock = asyncio.Lock()
+        self.send_buffer = bytearray()
+        self.send_threshold = int(self.SEND_INTERVAL * self.SAMPLE_RATE * 2)
+        self.flush_handle: asyncio.TimerHandle | None = None
+        self.flush_task: asyncio.Task | None = None
+        self.max_backlog_bytes = int(self.MAX_BACKLOG * self.SAMPLE_RATE * 2)
+        self.backlog_bytes = 0
+        self.dropped_batches = 0
+        self.pooled_connection: _ListenConnection | None = None
+        self.generation = 0
 
     async def start(self):
-        config = DeepgramClientOptions(options={"keepalive": "true"})
-        deepgram: DeepgramClient = DeepgramClient(os.getenv("DEEPGRAM_API_KEY", ""), config)
-        self.dg_connection = deepgram.listen.asyncwebsocket.v("1")
-        self.last_speech_start_time = time.time()
-
-        async def on_message(*_, result: Any, **__):
-            logger.debug("STT on_message handler called", extra={"handler": "on_message"})
-            sentence = result.channel.alternatives[0].transcript
-
-            if result.speech_final and len(sentence) > 0:
-                logger.info(f"STT final transcript: {sentence}")
-                self.current_sentence += sentence
-                if not self.current_sentence:
-                    self.last_speech_start_time = time.time()
-
-            elif len(sentence) > 0 and self.on_partial:
-                logger.info(f"STT partial transcript: {sentence}")
-                # Call partial callback for interim results (utterance_start detection)
-                await self.on_partial(sentence)
-
-        async def on_speech_started(result: Any, *_, **__):
-            logger.debug("STT on_speech_started handler called", extra={"handler": "on_speech_started"})
-            logger.info(f"Speech started: {result}")
-
-        async def on_utterance_end(result: Any, *_, **__):
-            logger.debug(
-                "STT on_utterance_end handler called",
-                extra={
-                    "handler": "on_utterance_end",
-                    "transcript_length": len(self.current_sentence),
-                },
-            )
-            logger.info(f"Utterance end: {result}")
-            if self.on_final and len(self.current_sentence) > 0:
-                await self.on_final(self.current_sentence)
-            self.current_sentence = ""
-            logger.info(f"Speech end: {time.time() - self.last_speech_start_time}")
+        pooled = await self._acquire_connection()
+        self.generation = pooled.claim(self)
+        self.pooled_connection = pooled  # type: ignore
+        self.dg_connection = pooled.connection
+        self.last_speech_start_time = time.monotonic()
+
+        self.is_running = True
+        async with self.send_lock:
+            while self.pending_audio:
+                await self.send_audio(self.pending_audio.popleft())
+        logger.debug("STT start handler called", extra={"handler": "start"})
+
+    async def _connect(self) -> PooledConnection:
+        dg_connection = get_deepgram_client(keepalive=True).listen.asyncwebsocket.v("1")
+        pooled = _ListenConnection(dg_connection)
+
+        # Handlers are registered once per connection and forward to whichever manager currently owns it.
+        # Each event is stamped with the generation whose audio produced it, so late events from an earlier
+        # session (e.g. an UtteranceEnd after the connection was pooled) never reach the next owner.
+        def on_message(*_, result: Any, **__):
+            end = result.start + result.duration
+            # A result answering Finalize covers all audio sent so far
+            pooled.mark_transcribed(pooled.sent_seconds if result.from_finalize else end)
+            return pooled.dispatch("on_message", result, generation=pooled.generation_at(end))
+
+        def on_speech_started(*_, speech_started: Any, **__):
+            generation = pooled.generation_at(speech_started.timestamp, inclusive=True)
+            return pooled.dispatch("on_speech_started", speech_started, generation=generation)
 
-        self.dg_connection.on(LiveTranscriptionEvents.Transcript, on_message)  # type: ignore
-        self.dg_connection.on(LiveTranscriptionEvents.SpeechStarted, on_speech_started)  # type: ignore
-        self.dg_connection.on(LiveTranscriptionEvents.UtteranceEnd, on_utterance_end)  # type: ignore
+        def on_utterance_end(*_, utterance_end: Any, **__):
+            generation = pooled.generation_at(utterance_end.last_word_end)
+            return pooled.dispatch("on_utterance_end", utterance_end, generation=generation)
 
-        if not await self.dg_connection.start(  # type: ignore
+        dg_connection.on(LiveTranscriptionEvents.Transcript, on_message)  # type: ignore
+        dg_connection.on(LiveTranscriptionEvents.SpeechStarted, on_speech_started)  # type: ignore
+        dg_connection.on(LiveTranscriptionEvents.UtteranceEnd, on_utterance_end)  # type: ignore
+
+        return await self.connection_pool.open(
+            pooled,
+            LiveTranscriptionEvents.Open,
             LiveOptions(
                 model="nova-3",
                 smart_format=True,
                 encoding="linear16",
                 channels=1,
-                sample_rate=16000,
+                sample_rate=self.SAMPLE_RATE,
                 interim_results=True,
                 utterance_end_ms="1000",
-            )
-        ):  # type: ignore
-            logger.error("Failed to start Deepgram connection")
+            ),
+        )
 
-        while not await self.dg_connection.is_connected():  # type: ignore
-            await asyncio.sleep(0.1)
+    async def on_message(self, result: Any):
+        sentence = result.channel.alternatives[0].transcript
+        if result.is_final or result.speech_final:
+            # The next segment's interims start a new throttle window instead of being compared against this one
+            self._reset_partials()
 
-        self.is_running = True
-        self.process_audio_task = asyncio.create_task(self.process_audio())
-        logger.debug("STT start handler called", extra={"handler": "start"})
+        if result.speech_final and len(sentence) > 0:
+            logger.info(f"STT final transcript: {sentence}")
+            # Timed from the first final segment of the utterance, checked before it is appended
+            if not self.current_sentence:
+                self.last_speech_start_time = time.monotonic()
+            self.current_sentence += sentence
 
-    async def process_audio(self):
-        while self.is_running:
-            try:
-                audio = await asyncio.wait_for(self.audio_queue.get(), timeout=0.5)
-                if audio:
-                    await self.dg_connection.send(audio)  # type: ignore
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error(
-                    f"STT process_audio handler error, {e}",
-                )
-                continue
+        elif len(sentence) > 0 and self.emit_partials and self.on_partial:
+            if not result.is_final:
+                now = time.monotonic()
+                if now - self.last_partial_time < self.PARTIAL_MIN_INTERVAL and len(sentence) - len(self.last_partial) < self.PARTIAL_MIN_NEW_CHARS:
+                    return
+                self.last_partial = sentence
+                self.last_partial_time = now
 
-    async def add_audio_chunk(self, audio: bytes):
+            logger.debug("STT partial transcript: %s", sentence)
+            # Call partial callback for interim results (utterance_start detection)
+            await self.on_partial(sentence)
+
+    def _reset_partials(self):
+        self.last_partial = ""
+        self.last_partial_time = 0.0
+
+    async def on_speech_started(self, result: Any):
+        logger.debug("STT on_speech_started handler called", extra={"handler": "on_speech_started"})
+        logger.info(f"Speech started: {result}")
+
+    async def on_utterance_end(self, result: Any):
         logger.debug(
-            "STT add_audio_chunk handler called",
-            extra={"handler": "add_audio_chunk", "audio_size": len(audio)},
+            "STT on_utterance_end handler called",
+            extra={
+                "handler": "on_utterance_end",
+                "transcript_length": len(self.current_sentence),
+            },
         )
-        await self.audio_queue.put(audio)
+        logger.info(f"Utterance end: {result}")
+        if self.on_final and len(self.current_sentence) > 0:
+            await self.on_final(self.current_sentence)
+        self.current_sentence = ""
+        self._reset_partials()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Speech end: %.3f", time.monotonic() - self.last_speech_start_time)
+
+    async def send_audio(self, audio: bytes):
+        pooled = self.pooled_connection
+        # After stop() the connection may already belong to another session
+        if pooled is None or pooled.owner_for(self.generation) is not self:
+            return
+        # Counted before sending, so an interrupted send makes stop() wait for audio that may never be transcribed
+        # and close the connection, rather than pool it with results still pending
+        pooled.sent_seconds += len(audio) / (self.SAMPLE_RATE * 2)
+        try:
+            await pooled.connection.send(audio)
+        except Exception as e:
+            logger.error(
+                f"STT send_audio handler error, {e}",
+            )
+
+    async def add_audio_chunk(self, audio: bytes):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("STT add_audio_chunk: %d bytes", len(audio))
+        if not audio:
+            return
+        if not self.is_running:
+            self.pending_audio.append(audio)
+            return
+
+        self.send_buffer += audio
+        if len(self.send_buffer) >= self.send_threshold:
+            await self.flush_audio()
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(self.SEND_INTERVAL, self._on_flush_timer)
+
+    def _on_flush_timer(self):
+        self.flush_handle = None
+        self.flush_task = asyncio.create_task(self.flush_audio())
+
+    async def flush_audio(self):
+        if self.flush_handle:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.send_buffer:
+            return
+
+        audio = bytes(self.send_buffer)
+        self.send_buffer.clear()
+        if self.backlog_bytes + len(audio) > self.max_backlog_bytes:
+            self.dropped_batches += 1
+            logger.warning(f"STT send backlog full, dropped {self.dropped_batches} audio batch(es)")
+            return
+
+        self.backlog_bytes += len(audio)
+        try:
+            # The lock keeps batches in order when the timer and a full buffer flush concurrently
+            async with self.send_lock:
+                await self.send_audio(audio)
+        finally:
+            self.backlog_bytes -= len(audio)
 
     async def stop(self):
         self.is_running = False
-        if self.process_audio_task:
-            self.process_audio_task.cancel()
-        await self.dg_connection.finish()  # type: ignore
+        if self.flush_handle:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if self.flush_task:
+            self.flush_task.cancel()
+            await asyncio.gather(self.flush_task, return_exceptions=True)
+            self.flush_task = None
+        self.send_buffer.clear()
+        self.pending_audio.clear()
+
+        pooled = self.pooled_connection
+        if pooled is None:
+            return
+        # Wait out any send still in flight, then stop forwarding events while the connection drains
+        async with self.send_lock:
+            self.pooled_connection = None
+            self.dg_connection = None
+            pooled.owner = None
+
+        if await self._drain(pooled):
+            await self.connection_pool.release(pooled)
+        else:
+            await self.connection_pool.close(pooled)
+
+    async def _drain(self, pooled: _ListenConnection) -> bool:
+        """Finalize the stream and wait until Deepgram has transcribed all audio sent on it."""
+        if pooled.transcribed_seconds >= pooled.sent_seconds - self.DRAIN_TOLERANCE:
+            return True
+
+        async def caught_up():
+            while pooled.transcribed_seconds < pooled.sent_seconds - self.DRAIN_TOLERANCE:
+                await pooled.progress.wait()
+                pooled.progress.clear()
+
+        try:
+            pooled.progress.clear()
+            if not await pooled.connection.finalize():
+                return False
+            await asyncio.wait_for(caught_up(), timeout=self.DRAIN_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"STT connection did not drain, closing it: {e}")
+            return False
+        return True
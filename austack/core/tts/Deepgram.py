@@ -1,75 +1,119 @@
 import asyncio
 import logging
-import os
+from dataclasses import dataclass, field
 from typing import Any
 from typing_extensions import Protocol
 
 
-import dotenv
 from deepgram import (
-    DeepgramClient,
     SpeakWebSocketEvents,
 )
 from austack.core.base import AsyncTextToSpeechBase
-
-dotenv.load_dotenv()
+from austack.core.deepgram_client import get_deepgram_client
+from austack.core.pool import ConnectionPool, PooledConnection, PooledManager
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _SpeakConnection(PooledConnection):
+    """A pooled speak connection that records when Deepgram confirms a Clear."""
+
+    cleared: asyncio.Event = field(default_factory=asyncio.Event)
+
+
 class OnAudioDataProtocol(Protocol):
     def __call__(self, audio: bytes) -> None: ...
 
 
-class DeepgramTextToSpeechManager(AsyncTextToSpeechBase):
+class DeepgramTextToSpeechManager(PooledManager, AsyncTextToSpeechBase):
+    connection_pool = ConnectionPool("TTS")
+    # How long stop() waits for Deepgram to confirm the Clear before the connection is closed instead of pooled
+    DRAIN_TIMEOUT = 2.0
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.is_running = False
         self.dg_connection = None
+        self.pooled_connection: _SpeakConnection | None = None
         self.text_buffer = ""
 
     async def start(self):
-        deepgram: DeepgramClient = DeepgramClient(
-            os.getenv("DEEPGRAM_API_KEY", ""),
-        )
-        self.dg_connection = deepgram.speak.asyncwebsocket.v("1")
+        pooled = await self._acquire_connection()
+        pooled.claim(self)
+        self.pooled_connection = pooled  # type: ignore
+        self.dg_connection = pooled.connection
+
+        self.is_running = True
+
+    async def _connect(self) -> PooledConnection:
+        dg_connection = get_deepgram_client().speak.asyncwebsocket.v("1")
+        pooled = _SpeakConnection(dg_connection)
 
-        async def on_binary_data(cls, data: Any, **kwargs):
-            # logger.debug("TTS on_binary_data handler called", extra={"handler": "on_binary_data", "data_size": len(data)})
-            if self.on_partial:
-                await self.on_partial(data)
+        # Audio is stamped with the generation at dispatch, so it is dropped once another session claims the connection.
+        def on_binary_data(cls, data: Any, **kwargs):
+            return pooled.dispatch("on_audio", data)
+
+        async def on_cleared(*_, **__):
+            pooled.cleared.set()
 
         async def on_error(cls, error: Any, **kwargs):
             logger.debug("TTS on_error handler called", extra={"handler": "on_error"})
             logger.error(f"Deepgram TTS Error: {error}")
 
-        self.dg_connection.on(SpeakWebSocketEvents.AudioData, on_binary_data)
-        self.dg_connection.on(SpeakWebSocketEvents.Error, on_error)
+        dg_connection.on(SpeakWebSocketEvents.AudioData, on_binary_data)
+        dg_connection.on(SpeakWebSocketEvents.Cleared, on_cleared)
+        dg_connection.on(SpeakWebSocketEvents.Error, on_error)
 
-        if not await self.dg_connection.start(
+        return await self.connection_pool.open(
+            pooled,
+            SpeakWebSocketEvents.Open,
             {
                 "model": "aura-2-thalia-en",
                 "encoding": "linear16",
                 "sample_rate": 16000,
-            }
-        ):
-            raise Exception("Failed to start Deepgram TTS connection")
+            },
+        )
 
-        while not await self.dg_connection.is_connected():
-            await asyncio.sleep(0.1)
-
-        self.is_running = True
+    async def on_audio(self, data: bytes):
+        if self.on_partial:
+            await self.on_partial(data)
 
     async def synthesize(self, text: str):
+        connection = self.dg_connection
+        if connection is None:
+            return
         try:
             logger.info(f"Sending text to Deepgram TTS: {text}")
-            if self.dg_connection and await self.dg_connection.is_connected():
-                await self.dg_connection.send_text(text)
-                await self.dg_connection.flush()
+            # Re-checked after the await so text is never sent once stop() has handed the connection back
+            if await connection.is_connected() and self.dg_connection is connection:
+                await connection.send_text(text)
+                await connection.flush()
         except Exception as e:
             logger.error(f"Error in synthesize: {e}")
 
     async def stop(self):
         self.is_running = False
-        if self.dg_connection:
-            await self.dg_connection.finish()  # type: ignore
+        pooled = self.pooled_connection
+        if pooled is None:
+            return
+        self.pooled_connection = None
+        self.dg_connection = None
+        pooled.owner = None
+
+        if await self._drain(pooled):
+            await self.connection_pool.release(pooled)
+        else:
+            await self.connection_pool.close(pooled)
+
+    async def _drain(self, pooled: _SpeakConnection) -> bool:
+        """Clear any queued synthesis and wait for Deepgram to confirm, so no audio from this session is left in flight."""
+        try:
+            pooled.cleared.clear()
+            if not await pooled.connection.clear():
+                return False
+            await asyncio.wait_for(pooled.cleared.wait(), timeout=self.DRAIN_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"TTS connection did not drain, closing it: {e}")
+            return False
+        return True
@@ -1,25 +1,34 @@
 import logging
+from typing import Callable, Optional
 from .base import AbstractLLMBase
 
 logger = logging.getLogger(__name__)
 
 
 class TurnTakingManager:
-    def __init__(self):
+    def __init__(self, on_turn_change: Optional[Callable[[bool], None]] = None):
         self.is_agent_turn = False
+        self.on_turn_change = on_turn_change
 
-    async def reset(self):
-        self.is_agent_turn = False
+    def _set_agent_turn(self, is_agent_turn: bool):
+        self.is_agent_turn = is_agent_turn
+        if self.on_turn_change:
+            self.on_turn_change(is_agent_turn)
+
+    def reset(self):
+        self._set_agent_turn(False)
 
     def start_agent_turn(self):
-        self.is_agent_turn = True
+        self._set_agent_turn(True)
         logger.info("Agent turn started")
         logger.debug("Agent turn started")
 
     async def start_user_turn(self, llm_manager: AbstractLLMBase):
-        if self.is_agent_turn:
-            # Interrupt the agent if it was speaking
-            await llm_manager.interrupt(save_in_conversation=True)
+        # Called for every partial transcript; nothing to do unless the agent holds the turn
+        if not self.is_agent_turn:
+            return
+
+        # Interrupt the agent if it was speaking
+        await llm_manager.interrupt(save_in_conversation=True)
         logger.info("User turn started")
-        self.is_agent_turn = False
-        logger.debug("User turn started")
+        self._set_agent_turn(False)
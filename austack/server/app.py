@@ -1,8 +1,16 @@
+import asyncio
 import logging
 from typing import Optional
+
+import dotenv
 from fastapi import FastAPI, WebSocket
 from austack.applications.conversation import ConversationApp
+from austack.core.base import AUDIO_SUBPROTOCOL
+from austack.core.llm.Baml import BamlLLMManager
+from austack.core.stt.Deepgram import DeepgramSpeechToTextManager
+from austack.core.tts.Deepgram import DeepgramTextToSpeechManager
 
+dotenv.load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -14,11 +22,47 @@ class AuStackApp:
         websocket_endpoint: str = "/ws/conversation",
         include_health_endpoint: bool = True,
         include_root_endpoint: bool = True,
+        prewarm_connections: int = 1,
+        prewarm_llm: bool = True,
     ):
         self.app = app or FastAPI(title="AuStack Conversation API", version="1.0.0")
         self.websocket_endpoint = websocket_endpoint
+        self.prewarm_connections = prewarm_connections
+        self.prewarm_llm = prewarm_llm
+        self.prewarm_task: Optional[asyncio.Task] = None
 
         self._add_routes(include_health_endpoint, include_root_endpoint)
+        if prewarm_connections > 0 or prewarm_llm:
+            self.app.add_event_handler("startup", self._start_prewarm)
+
+    async def _start_prewarm(self):
+        # Runs in the background so a slow or failing Deepgram handshake never blocks server startup
+        self.prewarm_task = asyncio.create_task(self._prewarm())
+
+    async def _prewarm(self):
+        await asyncio.gather(self._prewarm_deepgram(), self._prewarm_llm())
+
+    async def _prewarm_deepgram(self):
+        if self.prewarm_connections <= 0:
+            return
+        try:
+            await asyncio.gather(
+                DeepgramSpeechToTextManager.prewarm(self.prewarm_connections),
+                DeepgramTextToSpeechManager.prewarm(self.prewarm_connections),
+            )
+            logger.info(f"Prewarmed {self.prewarm_connections} Deepgram connection(s)")
+        except Exception as e:
+            logger.error(f"Error prewarming Deepgram connections: {e}")
+
+    async def _prewarm_llm(self):
+        # One request per process, not per session, so the warmup cost stays a single short completion
+        if not self.prewarm_llm:
+            return
+        try:
+            await BamlLLMManager.prewarm()
+            logger.info("Prewarmed LLM client")
+        except Exception as e:
+            logger.error(f"Error prewarming LLM client: {e}")
 
     def _add_routes(self, include_health: bool, include_root: bool):
         if include_root:
@@ -43,7 +87,9 @@ class AuStackApp:
 
         @self.app.websocket(self.websocket_endpoint)
         async def websocket_endpoint(websocket: WebSocket):  # type: ignore
-            await websocket.accept()
+            # Only select the audio subprotocol when offered; clients that request none are still accepted
+            subprotocol = AUDIO_SUBPROTOCOL if AUDIO_SUBPROTOCOL in websocket.scope.get("subprotocols", []) else None
+            await websocket.accept(subprotocol=subprotocol)
             conversation = ConversationApp(websocket=websocket)
             try:
                 await conversation.start()
@@ -54,10 +100,30 @@ class AuStackApp:
         return self.app
 
 
-app = AuStackApp().get_app()
+_app: Optional[FastAPI] = None
 
-if __name__ == "__main__":
+
+def get_app() -> FastAPI:
+    """Return the default server app, building it on first use."""
+    global _app
+    if _app is None:
+        _app = AuStackApp().get_app()
+    return _app
+
+
+def __getattr__(name: str):
+    # Keeps `uvicorn austack.server.app:app` working without building the app on import
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main():
     import uvicorn
 
     logger.info("Starting server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(get_app(), host="0.0.0.0", port=8000, ws="websockets")
+
+
+if __name__ == "__main__":
+    main()
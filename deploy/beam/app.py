@@ -23,6 +23,7 @@ image = (
     memory="8Gi",
 )
 def austack_app():
-    from austack.server.app import app
+    # Imported here so deploying doesn't need the server dependencies locally; this runs once per container
+    from austack.server.app import get_app
 
-    return app
+    return get_app()
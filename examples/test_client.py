@@ -54,7 +54,6 @@ def demo_custom_audio_config():
         chunk_size=2048,  # Larger chunks
         silence_threshold=0.005,  # More sensitive
         silence_timeout=1.5,  # Shorter timeout
-        send_interval=0.3,  # More frequent sending
     )
 
     # Create client with custom config
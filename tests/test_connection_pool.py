@@ -0,0 +1,128 @@
+import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("deepgram")
+
+from deepgram import LiveTranscriptionEvents  # noqa: E402
+
+from austack.core.pool import ConnectionPool  # noqa: E402
+from austack.core.stt.Deepgram import DeepgramSpeechToTextManager  # noqa: E402
+
+BYTES_PER_SECOND = DeepgramSpeechToTextManager.SAMPLE_RATE * 2
+
+
+def transcript(text: str, start: float, duration: float, speech_final: bool = False, from_finalize: bool = False):
+    return SimpleNamespace(
+        channel=SimpleNamespace(alternatives=[SimpleNamespace(transcript=text)]),
+        start=start,
+        duration=duration,
+        is_final=speech_final or from_finalize,
+        speech_final=speech_final,
+        from_finalize=from_finalize,
+    )
+
+
+class FakeListenConnection:
+    """Stands in for Deepgram's async listen websocket, dispatching events the way the SDK does."""
+
+    def __init__(self):
+        self.handlers = defaultdict(list)
+        self.sent = bytearray()
+        self.connected = False
+
+    def on(self, event, handler):
+        self.handlers[event].append(handler)
+
+    async def emit(self, event, **kwargs):
+        tasks = [asyncio.create_task(handler(self, **kwargs)) for handler in self.handlers[event]]
+        await asyncio.gather(*tasks)
+
+    async def start(self, options):
+        self.connected = True
+        asyncio.get_running_loop().call_soon(lambda: asyncio.ensure_future(self.emit(LiveTranscriptionEvents.Open)))
+        return True
+
+    async def send(self, audio):
+        self.sent += audio
+        return True
+
+    async def finalize(self):
+        # Deepgram answers Finalize with a final result covering everything sent so far
+        seconds = len(self.sent) / BYTES_PER_SECOND
+        result = transcript("from session A", 0.0, seconds, from_finalize=True)
+        asyncio.get_running_loop().call_soon(lambda: asyncio.ensure_future(self.emit(LiveTranscriptionEvents.Transcript, result=result)))
+        return True
+
+    async def is_connected(self):
+        return self.connected
+
+    async def finish(self):
+        self.connected = False
+
+
+class Recorder:
+    def __init__(self):
+        self.partials = []
+        self.finals = []
+
+    async def on_partial(self, text):
+        self.partials.append(text)
+
+    async def on_final(self, text):
+        self.finals.append(text)
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    fake = FakeListenConnection()
+    client = SimpleNamespace(listen=SimpleNamespace(asyncwebsocket=SimpleNamespace(v=lambda _: fake)))
+    monkeypatch.setattr("austack.core.stt.Deepgram.get_deepgram_client", lambda **_: client)
+    monkeypatch.setattr(DeepgramSpeechToTextManager, "connection_pool", ConnectionPool("STT"))
+    return fake
+
+
+async def test_reused_stt_connection_drops_events_from_previous_session(connection):
+    recorder_a = Recorder()
+    session_a = DeepgramSpeechToTextManager().setup(on_partial=recorder_a.on_partial, on_final=recorder_a.on_final)
+    await session_a.start()
+    await session_a.add_audio_chunk(bytes(BYTES_PER_SECOND))
+    await session_a.stop()
+
+    recorder_b = Recorder()
+    session_b = DeepgramSpeechToTextManager().setup(on_partial=recorder_b.on_partial, on_final=recorder_b.on_final)
+    await session_b.start()
+    assert session_b.dg_connection is connection
+
+    # Late events for session A's audio arrive after session B claimed the connection
+    await connection.emit(LiveTranscriptionEvents.Transcript, result=transcript("late from A", 0.5, 0.5))
+    await connection.emit(LiveTranscriptionEvents.Transcript, result=transcript("late final from A", 0.0, 1.0, speech_final=True))
+    await connection.emit(LiveTranscriptionEvents.SpeechStarted, speech_started=SimpleNamespace(timestamp=0.2))
+    await connection.emit(LiveTranscriptionEvents.UtteranceEnd, utterance_end=SimpleNamespace(last_word_end=0.9))
+    assert recorder_b.partials == []
+    assert recorder_b.finals == []
+    assert session_b.current_sentence == ""
+
+    # Session B still receives results for its own audio
+    await connection.emit(LiveTranscriptionEvents.Transcript, result=transcript("from B", 1.0, 0.2))
+    assert recorder_b.partials == ["from B"]
+    assert recorder_a.partials == []
+
+    await session_b.stop()
+
+
+async def test_stopped_stt_session_does_not_send_on_reused_connection(connection):
+    session_a = DeepgramSpeechToTextManager()
+    await session_a.start()
+    await session_a.stop()
+
+    session_b = DeepgramSpeechToTextManager()
+    await session_b.start()
+    assert session_b.dg_connection is connection
+
+    await session_a.send_audio(b"\x01" * 320)
+    assert bytes(connection.sent) == b""
+
+    await session_b.stop()